@@ -410,6 +410,11 @@ def scatter_add(input, dim, index, src):
     input : array-like
         Modified input array.
     """
+    if BACKEND_NAME == "numpy" and _np.ndim(index) == _np.ndim(src):
+        index_tuple = list(_np.indices(_np.shape(index), sparse=True))
+        index_tuple[dim] = index
+        _np.add.at(input, tuple(index_tuple), src)
+        return input
     if dim == 0:
         for i, val in zip(index, src):
             input[i] += val
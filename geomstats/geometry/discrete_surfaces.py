@@ -14,7 +14,7 @@ References
     arXiv, November 7, 2023. https://doi.org/10.48550/arXiv.2311.04382.
 """
 
-import math
+from collections import namedtuple
 
 import geomstats.backend as gs
 from geomstats._mesh import Surface
@@ -31,7 +31,12 @@ from geomstats.numerics.path import (
     UniformlySampledDiscretePath,
     UniformlySampledPathEnergy,
 )
-from geomstats.vectorization import get_batch_shape
+
+ElasticBasePointData = namedtuple(
+    "ElasticBasePointData",
+    ["vertex_areas", "laplacian", "one_forms", "dets", "areas", "ginv"],
+    defaults=(None,) * 6,
+)
 
 
 class DiscreteSurfaces(Manifold):
@@ -68,6 +73,21 @@ class DiscreteSurfaces(Manifold):
         self.n_faces = len(faces)
         self.n_vertices = int(gs.amax(self.faces) + 1)
         self.shape = (self.n_vertices, ambient_dim)
+
+        faces = gs.cast(faces, gs.int64)
+
+        self._id_vertices_flat = gs.reshape(faces, (-1,))
+        incidence_order = _scatter_order(self._id_vertices_flat)
+        self._id_incident_vertices = self._id_vertices_flat[incidence_order]
+        self._id_incident_faces = incidence_order // 3
+
+        id_vertices = gs.reshape(
+            gs.stack([faces[:, [1, 2, 0]], faces[:, [2, 0, 1]]], axis=0),
+            (2, self.n_faces * 3),
+        )
+        self._half_edge_order = _scatter_order(id_vertices[1])
+        self._id_half_edge_sources = id_vertices[0, self._half_edge_order]
+        self._id_half_edge_targets = id_vertices[1, self._half_edge_order]
         super().__init__(
             dim=self.n_vertices * ambient_dim,
             shape=(self.n_vertices, 3),
@@ -211,20 +231,21 @@ class DiscreteSurfaces(Manifold):
             vertex_i : array-like, shape=[..., n_faces, 3]
                 3D coordinates of the ith vertex of that face.
         """
-        batch_slc = tuple([slice(None)] * len(point.shape[:-2]))
-        face_coordinates = point[batch_slc + (self.faces,)]
+        face_coordinates = gs.reshape(
+            point[..., self._id_vertices_flat, :],
+            point.shape[:-2] + (self.n_faces, 3, 3),
+        )
         return (
-            face_coordinates[batch_slc + (slice(None), 0)],
-            face_coordinates[batch_slc + (slice(None), 1)],
-            face_coordinates[batch_slc + (slice(None), 2)],
+            face_coordinates[..., 0, :],
+            face_coordinates[..., 1, :],
+            face_coordinates[..., 2, :],
         )
 
     def _triangle_areas(self, point):
         """Compute triangle areas for each face of the surface.
 
-        Heron's formula gives the triangle's area in terms of its sides a b c:,
-        As the square root of the product s(s - a)(s - b)(s - c),
-        where s is the semiperimeter of the triangle s = (a + b + c)/2.
+        The area of a triangle is the norm of its normal, i.e. half the norm
+        of the cross product of two of its edges.
 
         Parameters
         ----------
@@ -233,22 +254,10 @@ class DiscreteSurfaces(Manifold):
 
         Returns
         -------
-        _ : array-like, shape=[..., n_faces, 1]
+        _ : array-like, shape=[..., n_faces]
             Triangle area of each face.
         """
-        vertex_0, vertex_1, vertex_2 = self._vertices(point)
-        len_edge_12 = gs.linalg.norm((vertex_1 - vertex_2), axis=-1)
-        len_edge_02 = gs.linalg.norm((vertex_0 - vertex_2), axis=-1)
-        len_edge_01 = gs.linalg.norm((vertex_0 - vertex_1), axis=-1)
-        half_perimeter = 0.5 * (len_edge_12 + len_edge_02 + len_edge_01)
-        return gs.sqrt(
-            (
-                half_perimeter
-                * (half_perimeter - len_edge_12)
-                * (half_perimeter - len_edge_02)
-                * (half_perimeter - len_edge_01)
-            ).clip(min=1e-6)
-        )
+        return _triangle_areas_from_normals(self.normals(point))
 
     def vertex_areas(self, point):
         """Compute vertex areas for a triangulated surface.
@@ -269,17 +278,11 @@ class DiscreteSurfaces(Manifold):
         """
         batch_shape = point.shape[:-2]
         n_vertices = point.shape[-2]
-        n_faces = self.faces.shape[0]
 
         area = self._triangle_areas(point)
 
-        id_vertices = gs.broadcast_to(
-            gs.reshape(self.faces, (-1,)), batch_shape + (math.prod(self.faces.shape),)
-        )
-        val = gs.reshape(
-            gs.broadcast_to(gs.expand_dims(area, axis=-2), batch_shape + (3, n_faces)),
-            batch_shape + (-1,),
-        )
+        val = area[..., self._id_incident_faces]
+        id_vertices = gs.broadcast_to(self._id_incident_vertices, val.shape)
         incident_areas = gs.zeros(batch_shape + (n_vertices,), dtype=val.dtype)
 
         incident_areas = gs.scatter_add(
@@ -348,7 +351,7 @@ class DiscreteSurfaces(Manifold):
             Area computed at each face of the triangulated surface.
         """
         surface_metrics_bp = self.surface_metric_matrices(point)
-        return gs.sqrt(gs.linalg.det(surface_metrics_bp))
+        return gs.sqrt(_det_2x2(surface_metrics_bp))
 
     @staticmethod
     def surface_metric_matrices_from_one_forms(one_forms):
@@ -367,7 +370,7 @@ class DiscreteSurfaces(Manifold):
             Surface metric matrices evaluated at each face of
             the triangulated surface.
         """
-        return gs.matmul(one_forms, Matrices.transpose(one_forms))
+        return gs.einsum("...ij,...kj->...ik", one_forms, one_forms)
 
     def surface_metric_matrices(self, point):
         """Compute the surface metric matrices.
@@ -400,7 +403,9 @@ class DiscreteSurfaces(Manifold):
         :math:`\Delta_q = - Tr(g_q^{-1} \nabla^2)`
         where :math:`g_q` is the surface metric matrix of :math:`q`.
 
-        The area of the triangles is computed using Heron's formula.
+        The area of the triangles is computed from the cross product of
+        their edges, and the cotangent of the angle at each vertex from the
+        inner product of the two edges incident to it.
 
         Parameters
         ----------
@@ -412,39 +417,41 @@ class DiscreteSurfaces(Manifold):
         _laplacian : callable
             Function that evaluates the mesh Laplacian operator at a
             tangent vector field to the surface.
+
+        Notes
+        -----
+        The cotangent weights and their sums at each vertex are computed
+        once, so that evaluating the operator only requires a gather and a
+        scatter of the tangent vector field. Half-edges are stored sorted by
+        the vertex they are scattered into, so that the scatters write to
+        contiguous memory.
         """
-        n_vertices, n_faces = point.shape[-2], self.faces.shape[0]
+        n_vertices = point.shape[-2]
         vertex_0, vertex_1, vertex_2 = self._vertices(point)
-        len_edge_12 = gs.linalg.norm((vertex_1 - vertex_2), axis=-1)
-        len_edge_02 = gs.linalg.norm((vertex_0 - vertex_2), axis=-1)
-        len_edge_01 = gs.linalg.norm((vertex_0 - vertex_1), axis=-1)
-
-        half_perimeter = 0.5 * (len_edge_12 + len_edge_02 + len_edge_01)
-        area = gs.sqrt(
-            (
-                half_perimeter
-                * (half_perimeter - len_edge_12)
-                * (half_perimeter - len_edge_02)
-                * (half_perimeter - len_edge_01)
-            ).clip(min=1e-6)
+        # edges[..., i, :] and edges[..., i + 1, :] meet at vertex i
+        edges = gs.stack(
+            [vertex_0 - vertex_2, vertex_1 - vertex_0, vertex_2 - vertex_1], axis=-2
         )
-        sq_len_edge_12, sq_len_edge_02, sq_len_edge_01 = (
-            len_edge_12 * len_edge_12,
-            len_edge_02 * len_edge_02,
-            len_edge_01 * len_edge_01,
+        area = _triangle_areas_from_normals(
+            0.5 * gs.cross(edges[..., 0, :], edges[..., 1, :])
         )
-        cot_12 = (sq_len_edge_02 + sq_len_edge_01 - sq_len_edge_12) / area
-        cot_02 = (sq_len_edge_12 + sq_len_edge_01 - sq_len_edge_02) / area
-        cot_01 = (sq_len_edge_12 + sq_len_edge_02 - sq_len_edge_01) / area
-        cot = gs.stack([cot_12, cot_02, cot_01], axis=-1)
-        cot /= 2.0
-        id_vertices_120 = self.faces[:, [1, 2, 0]]
-        id_vertices_201 = self.faces[:, [2, 0, 1]]
-        id_vertices = gs.reshape(
-            gs.stack([id_vertices_120, id_vertices_201], axis=0), (2, n_faces * 3)
+        # degenerate faces would give infinite cotangent weights
+        cot = -gs.einsum(
+            "...ij,...ij->...i", edges, edges[..., [1, 2, 0], :]
+        ) / gs.expand_dims(gs.maximum(area, 1e-12), axis=-1)
+        cot_flatten = gs.reshape(cot, point.shape[:-2] + (-1,))[
+            ..., self._half_edge_order
+        ]
+        cot_degrees = gs.scatter_add(
+            input=gs.zeros(point.shape[:-2] + (n_vertices,), dtype=cot.dtype),
+            dim=-1,
+            index=gs.broadcast_to(self._id_half_edge_targets, cot_flatten.shape),
+            src=cot_flatten,
         )
-
-        cot_flatten = gs.expand_dims(gs.reshape(cot, point.shape[:-2] + (-1,)), axis=-1)
+        cot_degrees = gs.expand_dims(cot_degrees, axis=-1)
+        cot_flatten = gs.expand_dims(cot_flatten, axis=-1)
+        id_sources = self._id_half_edge_sources
+        id_targets = gs.expand_dims(self._id_half_edge_targets, axis=-1)
 
         def _laplacian(tangent_vec):
             r"""Evaluate the mesh Laplacian operator.
@@ -472,42 +479,10 @@ class DiscreteSurfaces(Manifold):
                 Mesh Laplacian operator of the triangulated surface applied
                 to one its tangent vector tangent_vec.
             """
-            batch_shape = get_batch_shape(2, point, tangent_vec)
-            batch_slc = tuple([slice(None)] * len(batch_shape))
-
-            tangent_vec_diff = (
-                tangent_vec[batch_slc + (id_vertices[0],)]
-                - tangent_vec[batch_slc + (id_vertices[1],)]
+            return _apply_laplacian(
+                tangent_vec, id_sources, id_targets, cot_flatten, cot_degrees
             )
 
-            values = gs.einsum(
-                "...bd,...bd->...bd",
-                gs.broadcast_to(cot_flatten, batch_shape + (n_faces * 3, 3)),
-                tangent_vec_diff,
-            )
-
-            laplacian_at_tangent_vec = gs.zeros(
-                batch_shape + (n_vertices, 3), dtype=values.dtype
-            )
-
-            id_vertices_201 = id_vertices[1, :]
-            id_vertices_201 = gs.broadcast_to(
-                id_vertices_201, batch_shape + id_vertices_201.shape
-            )
-
-            for i_dim in range(3):
-                laplacian_at_tangent_vec[batch_slc + (slice(None), i_dim)] = (
-                    gs.scatter_add(
-                        input=laplacian_at_tangent_vec[
-                            batch_slc + (slice(None), i_dim)
-                        ],
-                        dim=-1,
-                        index=id_vertices_201,
-                        src=values[batch_slc + (slice(None), i_dim)],
-                    )
-                )
-            return laplacian_at_tangent_vec
-
         return _laplacian
 
 
@@ -542,6 +517,11 @@ class ElasticMetric(RiemannianMetric):
     a2 : float
         Second order parameter.
         Default: 1.
+    compute_dtype : dtype
+        Dtype in which the inner-product is computed, e.g. `gs.float32` to
+        halve the memory traffic on large meshes. The result is cast back
+        to the dtype of the tangent vectors.
+        Optional, default: dtype of the inputs.
 
     References
     ----------
@@ -555,7 +535,17 @@ class ElasticMetric(RiemannianMetric):
         arXiv, November 7, 2023. https://doi.org/10.48550/arXiv.2311.04382.
     """
 
-    def __init__(self, space, a0=1.0, a1=1.0, b1=1.0, c1=1.0, d1=1.0, a2=1.0):
+    def __init__(
+        self,
+        space,
+        a0=1.0,
+        a1=1.0,
+        b1=1.0,
+        c1=1.0,
+        d1=1.0,
+        a2=1.0,
+        compute_dtype=None,
+    ):
         super().__init__(space=space)
         self.a0 = a0
         self.a1 = a1
@@ -563,6 +553,7 @@ class ElasticMetric(RiemannianMetric):
         self.c1 = c1
         self.d1 = d1
         self.a2 = a2
+        self.compute_dtype = compute_dtype
 
         if gs.has_autodiff():
             self.exp_solver = DiscreteSurfacesExpSolver(space, n_steps=10)
@@ -605,176 +596,8 @@ class ElasticMetric(RiemannianMetric):
             axis=-1,
         )
 
-    def _inner_product_a1(self, ginvdga, ginvdgb, areas_bp):
-        r"""Compute a1 term of order 1 within the inner-product.
-
-        Denote h and k the tangent vectors a and b respectively.
-        Denote q the base point.
-
-        This method computes :math:`G_{a_1} = a_1.g_q^{-1} <dh_m, dk_m>`, i.e.
-
-        .. math::
-
-            G_{a_1}(h, h) = \sum_{f \in F} \operatorname{tr}\left(g_f^{-1}
-            \delta g_f g_f^{-1} \delta g_f\right) \operatorname{vol}_f
-
-        Parameters
-        ----------
-        ginvdga : array-like, shape=[..., n_faces, 2, 2]
-            Product of the inverse of the surface metric matrices
-            with their differential at a.
-        ginvdgb : array-like, shape=[..., n_faces, 2, 2]
-            Product of the inverse of the surface metric matrices
-            with their differential at b.
-        areas_bp : array-like, shape=[..., n_faces,]
-            Areas of the faces of the surface given by the base point.
-
-        Returns
-        -------
-        inner_prod_a1 : array-like, shape=[...,]
-            Term of order 1, and coefficient a1, of the inner-product.
-        """
-        return self.a1 * gs.sum(
-            gs.trace(gs.matmul(ginvdga, ginvdgb)) * areas_bp,
-            axis=-1,
-        )
-
-    def _inner_product_b1(self, ginvdga, ginvdgb, areas_bp):
-        r"""Compute b1 term of order 1 within the inner-product.
-
-        Denote h and k the tangent vectors a and b respectively.
-        Denote q the base point.
-
-        This method computes :math:`G_{b_1} = b_1.g_q^{-1} <dh_+, dk_+>`, i.e.
-
-        .. math::
-
-            G_{b_1}(h, h) = \sum_{f \in F} \operatorname{tr}
-            \left(g_f^{-1} \delta g_f\right)^2 \operatorname{vol}_f
-
-        Parameters
-        ----------
-        ginvdga : array-like, shape=[..., n_faces, 2, 2]
-            Product of the inverse of the surface metric matrices
-            with their differential at a.
-        ginvdgb : array-like, shape=[..., n_faces, 2, 2]
-            Product of the inverse of the surface metric matrices
-            with their differential at b.
-        areas_bp : array-like, shape=[..., n_faces,]
-            Areas of the faces of the surface given by the base point.
-
-        Returns
-        -------
-        inner_prod_b1 : array-like, shape=[...,]
-            Term of order 1, and coefficient b1, of the inner-product.
-        """
-        return self.b1 * gs.sum(
-            gs.trace(ginvdga) * gs.trace(ginvdgb) * areas_bp,
-            axis=-1,
-        )
-
-    def _inner_product_c1(self, point_a, point_b, normals_bp, areas_bp):
-        r"""Compute c1 term of order 1 within the inner-product.
-
-        Denote h and k the tangent vectors a and b respectively.
-        Denote q the base point.
-
-        This method computes :math:`G_{c_1} = c_1.g_q^{-1} <dh_\perp, dk_\perp>`,
-        i.e.
-
-        .. math::
-
-            G_{c_1}(h, h) = \sum_{f \in F}\left\langle\delta n_f,
-            \delta n_f\right\rangle \mathrm{vol}_f
-
-        Parameters
-        ----------
-        point_a : array-like, shape=[..., n_vertices, 3]
-            Point a corresponding to tangent vec a.
-        point_b : array-like, shape=[..., n_vertices, 3]
-            Point b corresponding to tangent vec b.
-        normals_bp : array-like, shape=[..., n_faces, 3]
-            Normals of each face of the surface given by the base point.
-        areas_bp : array-like, shape=[..., n_faces,]
-            Areas of the faces of the surface given by the base point.
-
-        Returns
-        -------
-        inner_prod_c1 : array-like, shape=[...,]
-            Term of order 1, and coefficient c1, of the inner-product.
-        """
-        dna = self._space.normals(point_a) - normals_bp
-        dnb = self._space.normals(point_b) - normals_bp
-
-        return self.c1 * gs.sum(gs.dot(dna, dnb) * areas_bp, axis=-1)
-
-    def _inner_product_d1(
-        self, one_forms_a, one_forms_b, one_forms_bp, areas_bp, ginv_bp
-    ):
-        r"""Compute d1 term of order 1 within the inner-product.
-
-        Denote h and k the tangent vectors a and b respectively.
-        Denote q the base point.
-
-        This method computes :math:`G_{d_1} = d_1.g_q^{-1} <dh_0, dk_0>`, i.e.
-
-        .. math::
-
-            G_{d_1}(h, h) = \sum_{f \in F} \operatorname{tr}\left(g_f^{-1}
-            \xi_f g_f^{-1} \xi_f^T\right) \operatorname{vol}_f
-
-        where :math:`\xi_f=d q_f^T d h_f-d h_f^T d q_f`.
-
-        Parameters
-        ----------
-        one_forms_a : array-like, shape=[..., n_faces, 2, 3]
-            One forms at point a corresponding to tangent vec a.
-        one_forms_b : array-like, shape=[..., n_faces, 2, 3]
-            One forms at point b corresponding to tangent vec b.
-        one_forms_bp : array-like, shape=[..., 2, 3]
-            One forms at base point.
-        areas_bp : array-like, shape=[..., n_faces,]
-            Areas of the faces of the surface given by the base point.
-        ginv_bp : array-like, shape=[..., n_faces, 2, 2]
-            Inverses of the surface metric matrices at each face.
-
-        Returns
-        -------
-        inner_prod_d1 : array-like, shape=[...,]
-            Term of order 1, and coefficient d1, of the inner-product.
-        """
-        one_forms_bp_t = Matrices.transpose(one_forms_bp)
-
-        aux = gs.matmul(one_forms_bp_t, ginv_bp)
-
-        xa = one_forms_a - one_forms_bp
-        xa_0 = gs.matmul(
-            aux,
-            gs.matmul(xa, one_forms_bp_t)
-            - gs.matmul(one_forms_bp, Matrices.transpose(xa)),
-        )
-
-        xb = one_forms_b - one_forms_bp
-        xb_0 = gs.matmul(
-            aux,
-            gs.matmul(xb, one_forms_bp_t)
-            - gs.matmul(one_forms_bp, Matrices.transpose(xb)),
-        )
-
-        return self.d1 * gs.sum(
-            gs.trace(
-                Matrices.mul(
-                    xa_0,
-                    ginv_bp,
-                    Matrices.transpose(xb_0),
-                ),
-            )
-            * areas_bp,
-            axis=-1,
-        )
-
     def _inner_product_a2(
-        self, tangent_vec_a, tangent_vec_b, base_point, vertex_areas_bp
+        self, tangent_vec_a, tangent_vec_b, laplacian_bp, vertex_areas_bp
     ):
         r"""Compute term of order 2 within the inner-product.
 
@@ -795,8 +618,8 @@ class ElasticMetric(RiemannianMetric):
             Tangent vector at base point.
         tangent_vec_b : array-like, shape=[..., n_vertices, 3]
             Tangent vector at base point.
-        base_point : array-like, shape=[..., n_vertices, 3]
-            Base point, a surface i.e. the 3D coordinates of its vertices.
+        laplacian_bp : callable
+            Mesh Laplacian operator of the base point.
         vertex_areas_bp : array-like, shape=[..., n_vertices, 1]
             Vertex areas for each vertex of the base_point.
 
@@ -805,17 +628,86 @@ class ElasticMetric(RiemannianMetric):
         inner_prod_a2 : array-like, shape=[...,]
             Term of order 2, and coefficient a2, of the inner-product.
         """
-        laplacian_at_base_point = self._space.laplacian(base_point)
         return self.a2 * gs.sum(
             gs.dot(
-                laplacian_at_base_point(tangent_vec_a),
-                laplacian_at_base_point(tangent_vec_b),
+                laplacian_bp(tangent_vec_a),
+                laplacian_bp(tangent_vec_b),
             )
             / vertex_areas_bp,
             axis=-1,
         )
 
-    def inner_product(self, tangent_vec_a, tangent_vec_b, base_point):
+    def prepare(self, base_point):
+        """Precompute the quantities of the inner-product at a base point.
+
+        The inner-product is often evaluated many times at the same base
+        point, e.g. when solving for geodesics. The quantities depending
+        only on the base point can then be computed once and passed to
+        `inner_product`.
+
+        Parameters
+        ----------
+        base_point : array-like, shape=[..., n_vertices, 3]
+            Surface, as the 3D coordinates of the vertices of its triangulation.
+
+        Returns
+        -------
+        base_point_data : ElasticBasePointData
+            Quantities at the base point required by the non-zero terms of
+            the inner-product, among `vertex_areas`, `laplacian`,
+            `one_forms`, `dets`, `areas` and `ginv`. The other fields are
+            None, so the data only applies to the coefficients of the metric
+            at the time it is prepared.
+        """
+        if self.compute_dtype is not None:
+            base_point = gs.cast(base_point, self.compute_dtype)
+
+        base_point_data = {}
+        if self.a0 > 0 or self.a2 > 0:
+            base_point_data["vertex_areas"] = self._space.vertex_areas(base_point)
+            if self.a2 > 0:
+                base_point_data["laplacian"] = self._space.laplacian(base_point)
+        if self.a1 > 0 or self.b1 > 0 or self.c1 > 0 or self.d1 > 0:
+            one_forms_bp = self._space.surface_one_forms(base_point)
+            surface_metrics_bp = self._space.surface_metric_matrices_from_one_forms(
+                one_forms_bp
+            )
+            dets_bp = _det_2x2(surface_metrics_bp)
+            base_point_data["one_forms"] = one_forms_bp
+            base_point_data["dets"] = dets_bp
+            base_point_data["areas"] = gs.sqrt(dets_bp)
+            if self.a1 > 0 or self.b1 > 0:
+                base_point_data["ginv"] = _inv_2x2(surface_metrics_bp)
+        return ElasticBasePointData(**base_point_data)
+
+    def _check_base_point_data(self, base_point_data):
+        """Check that base point data holds the quantities of non-zero terms.
+
+        Parameters
+        ----------
+        base_point_data : ElasticBasePointData
+            Quantities at the base point, as returned by `prepare`.
+        """
+        required = []
+        if self.a0 > 0 or self.a2 > 0:
+            required.append("vertex_areas")
+        if self.a2 > 0:
+            required.append("laplacian")
+        if self.a1 > 0 or self.b1 > 0 or self.c1 > 0 or self.d1 > 0:
+            required.extend(["one_forms", "dets", "areas"])
+        if self.a1 > 0 or self.b1 > 0:
+            required.append("ginv")
+
+        missing = [name for name in required if getattr(base_point_data, name) is None]
+        if missing:
+            raise ValueError(
+                f"base_point_data lacks {missing}: it was prepared with other "
+                "coefficients. Call `prepare` again with the current ones."
+            )
+
+    def inner_product(
+        self, tangent_vec_a, tangent_vec_b, base_point, base_point_data=None
+    ):
         r"""Compute inner product between two tangent vectors at a base point.
 
         The inner-product has 6 terms, where each term corresponds to
@@ -847,21 +739,39 @@ class ElasticMetric(RiemannianMetric):
             Tangent vector at base point.
         base_point : array-like, shape=[..., n_vertices, 3]
             Surface, as the 3D coordinates of the vertices of its triangulation.
+        base_point_data : ElasticBasePointData
+            Quantities at the base point, as returned by `prepare` with the
+            current coefficients of the metric.
+            Optional, default: computed from base_point.
 
         Returns
         -------
         inner_prod : array-like, shape=[...]
             Inner product.
+
+        Notes
+        -----
+        The tangent vectors may carry more leading dimensions than the base
+        point, e.g. a batch of pairs of tangent vectors at a single base
+        point. The quantities at the base point are then computed once and
+        broadcast to all the pairs.
         """
+        dtype = tangent_vec_a.dtype
+        if self.compute_dtype is not None:
+            tangent_vec_a = gs.cast(tangent_vec_a, self.compute_dtype)
+            tangent_vec_b = gs.cast(tangent_vec_b, self.compute_dtype)
+
+        if base_point_data is None:
+            base_point_data = self.prepare(base_point)
+        else:
+            self._check_base_point_data(base_point_data)
+
         inner_prod_a0 = 0.0
-        inner_prod_a1 = 0.0
         inner_prod_a2 = 0.0
-        inner_prod_b1 = 0.0
-        inner_prod_c1 = 0.0
-        inner_prod_d1 = 0.0
+        inner_prod_order_1 = 0.0
 
         if self.a0 > 0 or self.a2 > 0:
-            vertex_areas_bp = self._space.vertex_areas(base_point)
+            vertex_areas_bp = base_point_data.vertex_areas
             if self.a0 > 0:
                 inner_prod_a0 = self._inner_product_a0(
                     tangent_vec_a, tangent_vec_b, vertex_areas_bp=vertex_areas_bp
@@ -870,65 +780,27 @@ class ElasticMetric(RiemannianMetric):
                 inner_prod_a2 = self._inner_product_a2(
                     tangent_vec_a,
                     tangent_vec_b,
-                    base_point=base_point,
+                    laplacian_bp=base_point_data.laplacian,
                     vertex_areas_bp=vertex_areas_bp,
                 )
-        if self.a1 > 0 or self.b1 > 0 or self.c1 > 0 or self.b1 > 0:
-            one_forms_bp = self._space.surface_one_forms(base_point)
-            surface_metrics_bp = self._space.surface_metric_matrices_from_one_forms(
-                one_forms_bp
+        if self.a1 > 0 or self.b1 > 0 or self.c1 > 0 or self.d1 > 0:
+            inner_prod_order_1 = _inner_product_order_1(
+                self._space.surface_one_forms(tangent_vec_a),
+                self._space.surface_one_forms(tangent_vec_b),
+                base_point_data.one_forms,
+                base_point_data.dets,
+                base_point_data.areas,
+                base_point_data.ginv,
+                a1=self.a1,
+                b1=self.b1,
+                c1=self.c1,
+                d1=self.d1,
             )
-            areas_bp = gs.sqrt(gs.linalg.det(surface_metrics_bp))
-
-            point_a = base_point + tangent_vec_a
-            point_b = base_point + tangent_vec_b
 
-            if self.c1 > 0:
-                normals_bp = self._space.normals(base_point)
-                inner_prod_c1 = self._inner_product_c1(
-                    point_a, point_b, normals_bp, areas_bp
-                )
-            if self.d1 > 0 or self.b1 > 0 or self.a1 > 0:
-                ginv_bp = gs.linalg.inv(surface_metrics_bp)
-                one_forms_a = self._space.surface_one_forms(point_a)
-                one_forms_b = self._space.surface_one_forms(point_b)
-                if self.d1 > 0:
-                    inner_prod_d1 = self._inner_product_d1(
-                        one_forms_a,
-                        one_forms_b,
-                        one_forms_bp,
-                        areas_bp,
-                        ginv_bp,
-                    )
-
-                if self.b1 > 0 or self.a1 > 0:
-                    surface_metrics_a = (
-                        self._space.surface_metric_matrices_from_one_forms(one_forms_a)
-                    )
-                    surface_metrics_b = (
-                        self._space.surface_metric_matrices_from_one_forms(one_forms_b)
-                    )
-                    dga = surface_metrics_a - surface_metrics_bp
-                    dgb = surface_metrics_b - surface_metrics_bp
-                    ginvdga = gs.matmul(ginv_bp, dga)
-                    ginvdgb = gs.matmul(ginv_bp, dgb)
-                    if self.a1 > 0:
-                        inner_prod_a1 = self._inner_product_a1(
-                            ginvdga, ginvdgb, areas_bp
-                        )
-                    if self.b1 > 0:
-                        inner_prod_b1 = self._inner_product_b1(
-                            ginvdga, ginvdgb, areas_bp
-                        )
-
-        return (
-            inner_prod_a0
-            + inner_prod_a1
-            + inner_prod_a2
-            + inner_prod_b1
-            + inner_prod_c1
-            + inner_prod_d1
-        )
+        inner_prod = inner_prod_a0 + inner_prod_order_1 + inner_prod_a2
+        if self.compute_dtype is not None:
+            inner_prod = gs.cast(inner_prod, dtype)
+        return inner_prod
 
 
 class DiscreteSurfacesExpSolver(ExpSolver):
@@ -966,6 +838,8 @@ class DiscreteSurfacesExpSolver(ExpSolver):
             Computes energy wrt next next point.
         """
         zeros = gs.zeros_like(current_point)
+        current_point_data = self._space.metric.prepare(current_point)
+        next_point_data = self._space.metric.prepare(next_point)
 
         def energy_objective(flat_next_next_point):
             """Compute the energy objective to minimize.
@@ -992,7 +866,10 @@ class DiscreteSurfacesExpSolver(ExpSolver):
                 geodesic that is being computed.
                 """
                 return self._space.metric.inner_product(
-                    current_to_next, tangent_vec, current_point
+                    current_to_next,
+                    tangent_vec,
+                    current_point,
+                    base_point_data=current_point_data,
                 )
 
             def _inner_product_with_next_to_next_next(tangent_vec):
@@ -1003,7 +880,10 @@ class DiscreteSurfacesExpSolver(ExpSolver):
                 geodesic that is being computed.
                 """
                 return self._space.metric.inner_product(
-                    next_to_next_next, tangent_vec, next_point
+                    next_to_next_next,
+                    tangent_vec,
+                    next_point,
+                    base_point_data=next_point_data,
                 )
 
             def _norm(base_point):
@@ -1458,6 +1338,271 @@ class ReparametrizationBundle(FiberBundle):
         super().__init__(total_space, aligner=aligner)
 
 
+def _apply_laplacian(tangent_vec, id_sources, id_targets, cot_flatten, cot_degrees):
+    """Apply a mesh Laplacian operator to a tangent vector.
+
+    Parameters
+    ----------
+    tangent_vec : array-like, shape=[..., n_vertices, 3]
+        Tangent vector, i.e. a vector field on the triangulated surface.
+    id_sources : array-like, shape=[n_faces * 3]
+        Source vertex of each half-edge, with half-edges sorted by target.
+    id_targets : array-like, shape=[n_faces * 3, 1]
+        Target vertex of each half-edge, in increasing order.
+    cot_flatten : array-like, shape=[..., n_faces * 3, 1]
+        Cotangent weight of each half-edge, in the same order.
+    cot_degrees : array-like, shape=[..., n_vertices, 1]
+        Sum of the cotangent weights of the half-edges targeting each vertex.
+
+    Returns
+    -------
+    laplacian_at_tangent_vec : array-like, shape=[..., n_vertices, 3]
+        Mesh Laplacian operator applied to the tangent vector.
+    """
+    values = cot_flatten * tangent_vec[..., id_sources, :]
+
+    laplacian_at_tangent_vec = gs.scatter_add(
+        input=gs.zeros(values.shape[:-2] + tangent_vec.shape[-2:], dtype=values.dtype),
+        dim=-2,
+        index=gs.broadcast_to(id_targets, values.shape),
+        src=values,
+    )
+    return laplacian_at_tangent_vec - cot_degrees * tangent_vec
+
+
+def _scatter_order(index):
+    """Compute the permutation sorting scatter indices.
+
+    Scattering in this order writes to consecutive entries of the output,
+    which keeps memory accesses local. Ties keep their original order.
+
+    Parameters
+    ----------
+    index : array-like, shape=[n]
+        Indices of the entries to scatter into.
+
+    Returns
+    -------
+    order : array-like, shape=[n]
+        Permutation such that index[order] is sorted.
+    """
+    n_index = index.shape[0]
+    keys = index * n_index + gs.arange(n_index)
+    return gs.sort(keys) % n_index
+
+
+def _triangle_areas_from_normals(normals):
+    """Compute triangle areas from the normals of the faces.
+
+    Parameters
+    ----------
+    normals : array-like, shape=[..., n_faces, 3]
+        Normals of each face, of norm the area of the triangle.
+
+    Returns
+    -------
+    _ : array-like, shape=[..., n_faces]
+        Triangle area of each face.
+    """
+    return gs.linalg.norm(normals, axis=-1)
+
+
+def _surface_metric_matrices_diff(d_one_forms, one_forms_bp):
+    r"""Compute the difference of surface metric matrices from one forms.
+
+    With :math:`A = B + \delta A`, the difference
+    :math:`A A^T - B B^T` is evaluated as :math:`\delta A A^T + B \delta A^T`,
+    which does not suffer from cancellation when :math:`\delta A` is small.
+
+    Parameters
+    ----------
+    d_one_forms : array-like, shape=[..., n_faces, 2, 3]
+        One forms of a tangent vector at the base point.
+    one_forms_bp : array-like, shape=[..., n_faces, 2, 3]
+        One forms at the base point.
+
+    Returns
+    -------
+    dg : array-like, shape=[..., n_faces, 2, 2]
+        Difference between the surface metric matrices at the base point
+        shifted by the tangent vector and at the base point.
+    """
+    one_forms = one_forms_bp + d_one_forms
+    return gs.einsum("...ij,...kj->...ik", d_one_forms, one_forms) + gs.einsum(
+        "...ij,...kj->...ik", one_forms_bp, d_one_forms
+    )
+
+
+def _normals_diff(d_one_forms, one_forms_bp):
+    r"""Compute the difference of face normals from one forms.
+
+    Normals are half the cross product of the two one forms of a face.
+    With :math:`A = B + \delta A`, the difference of normals is expanded as
+    :math:`(B_0 \times \delta A_1 + \delta A_0 \times A_1) / 2`.
+
+    Parameters
+    ----------
+    d_one_forms : array-like, shape=[..., n_faces, 2, 3]
+        One forms of a tangent vector at the base point.
+    one_forms_bp : array-like, shape=[..., n_faces, 2, 3]
+        One forms at the base point.
+
+    Returns
+    -------
+    dn : array-like, shape=[..., n_faces, 3]
+        Difference between the normals at the base point shifted by the
+        tangent vector and at the base point.
+    """
+    one_forms = one_forms_bp + d_one_forms
+    return 0.5 * (
+        gs.cross(one_forms_bp[..., 0, :], d_one_forms[..., 1, :])
+        + gs.cross(d_one_forms[..., 0, :], one_forms[..., 1, :])
+    )
+
+
+def _skew_diff(d_one_forms, one_forms_bp):
+    r"""Compute the off-diagonal entry of the skew part of the metric differential.
+
+    The matrix :math:`\xi = \delta A B^T - B \delta A^T` is antisymmetric, so
+    it is determined by its entry :math:`\xi_{01}`.
+
+    Parameters
+    ----------
+    d_one_forms : array-like, shape=[..., n_faces, 2, 3]
+        One forms of a tangent vector at the base point.
+    one_forms_bp : array-like, shape=[..., n_faces, 2, 3]
+        One forms at the base point.
+
+    Returns
+    -------
+    xi : array-like, shape=[..., n_faces]
+        Entry :math:`\xi_{01}` at each face.
+    """
+    return gs.sum(
+        d_one_forms[..., 0, :] * one_forms_bp[..., 1, :]
+        - one_forms_bp[..., 0, :] * d_one_forms[..., 1, :],
+        axis=-1,
+    )
+
+
+def _inner_product_order_1(
+    d_one_forms_a,
+    d_one_forms_b,
+    one_forms_bp,
+    dets_bp,
+    areas_bp,
+    ginv_bp,
+    a1,
+    b1,
+    c1,
+    d1,
+):
+    r"""Compute the terms of order 1 of the elastic inner-product.
+
+    Denote h and k the tangent vectors a and b respectively, and q the base
+    point. At each face f, the terms of order 1 are accumulated and
+    integrated at once:
+
+    .. math::
+
+        \sum_{f \in F} \Big(a_1 \operatorname{tr}\left(g_f^{-1}
+        \delta g_f g_f^{-1} \delta g_f\right)
+        + b_1 \operatorname{tr}\left(g_f^{-1} \delta g_f\right)^2
+        + c_1 \left\langle\delta n_f, \delta n_f\right\rangle
+        + d_1 \operatorname{tr}\left(g_f^{-1} \xi_f g_f^{-1} \xi_f^T\right)
+        \Big) \operatorname{vol}_f
+
+    where :math:`\xi_f=d h_f d q_f^T-d q_f d h_f^T`. As :math:`\xi_f` is a 2x2
+    antisymmetric matrix, the last trace equals
+    :math:`2 \xi_{f, 01}^2 / \det g_f`.
+
+    Parameters
+    ----------
+    d_one_forms_a : array-like, shape=[..., n_faces, 2, 3]
+        One forms of tangent vec a.
+    d_one_forms_b : array-like, shape=[..., n_faces, 2, 3]
+        One forms of tangent vec b.
+    one_forms_bp : array-like, shape=[..., n_faces, 2, 3]
+        One forms at base point.
+    dets_bp : array-like, shape=[..., n_faces,]
+        Determinants of the surface metric matrices at each face.
+    areas_bp : array-like, shape=[..., n_faces,]
+        Areas of the faces of the surface given by the base point.
+    ginv_bp : array-like, shape=[..., n_faces, 2, 2]
+        Inverses of the surface metric matrices at each face.
+        Only used if a1 or b1 is non-zero.
+    a1, b1, c1, d1 : float
+        Coefficients of the terms of order 1.
+
+    Returns
+    -------
+    inner_prod_order_1 : array-like, shape=[...,]
+        Terms of order 1 of the inner-product.
+    """
+    integrand = 0.0
+    if a1 > 0 or b1 > 0:
+        ginvdga = gs.matmul(
+            ginv_bp, _surface_metric_matrices_diff(d_one_forms_a, one_forms_bp)
+        )
+        ginvdgb = gs.matmul(
+            ginv_bp, _surface_metric_matrices_diff(d_one_forms_b, one_forms_bp)
+        )
+        if a1 > 0:
+            integrand = integrand + a1 * Matrices.trace_product(ginvdga, ginvdgb)
+        if b1 > 0:
+            integrand = integrand + b1 * gs.trace(ginvdga) * gs.trace(ginvdgb)
+    if c1 > 0:
+        integrand = integrand + c1 * gs.dot(
+            _normals_diff(d_one_forms_a, one_forms_bp),
+            _normals_diff(d_one_forms_b, one_forms_bp),
+        )
+    if d1 > 0:
+        xia = _skew_diff(d_one_forms_a, one_forms_bp)
+        xib = _skew_diff(d_one_forms_b, one_forms_bp)
+        integrand = integrand + 2 * d1 * xia * xib / dets_bp
+
+    return gs.sum(integrand * areas_bp, axis=-1)
+
+
+def _det_2x2(mat):
+    """Compute the determinants of 2x2 matrices in closed form.
+
+    Parameters
+    ----------
+    mat : array-like, shape=[..., 2, 2]
+        Matrices.
+
+    Returns
+    -------
+    det : array-like, shape=[...,]
+        Determinants.
+    """
+    return mat[..., 0, 0] * mat[..., 1, 1] - mat[..., 0, 1] * mat[..., 1, 0]
+
+
+def _inv_2x2(mat):
+    """Compute the inverses of 2x2 matrices from their adjugates.
+
+    Parameters
+    ----------
+    mat : array-like, shape=[..., 2, 2]
+        Invertible matrices.
+
+    Returns
+    -------
+    inv : array-like, shape=[..., 2, 2]
+        Inverses.
+    """
+    adjugate = gs.stack(
+        [
+            gs.stack([mat[..., 1, 1], -mat[..., 0, 1]], axis=-1),
+            gs.stack([-mat[..., 1, 0], mat[..., 0, 0]], axis=-1),
+        ],
+        axis=-2,
+    )
+    return adjugate / _det_2x2(mat)[..., None, None]
+
+
 def _is_iterable(obj):
     """Check if an object is an iterable."""
     return isinstance(obj, (list, tuple))
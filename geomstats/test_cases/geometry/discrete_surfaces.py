@@ -64,6 +64,21 @@ class DiscreteSurfacesTestCase(ManifoldTestCase):
         res = self.space.vertex_areas(point)
         self.assertAllClose(res, expected, atol=atol)
 
+    def test_areas_against_face_areas(self, point, atol):
+        """Test triangle and vertex areas against face areas.
+
+        Face areas are the areas of the parallelograms spanned by the one
+        forms, i.e. twice the triangle areas. As each triangle is incident
+        to three vertices, vertex areas sum to the face areas.
+        """
+        face_areas = self.space.face_areas(point)
+
+        res = 2 * self.space._triangle_areas(point)
+        self.assertAllClose(res, face_areas, atol=atol)
+
+        res = gs.sum(self.space.vertex_areas(point), axis=-1)
+        self.assertAllClose(res, gs.sum(face_areas, axis=-1), atol=atol)
+
     def test_normals(self, point, expected, atol):
         """Test normals.
 
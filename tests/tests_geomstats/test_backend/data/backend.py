@@ -246,3 +246,46 @@ class BackendTestData(TestData):
         ]
 
         return self.generate_tests(smoke_data)
+
+
+class ScatterAddTestData(TestData):
+    def func_out_allclose_test_data(self):
+        smoke_data = [
+            dict(
+                func_name="scatter_add",
+                kwargs={
+                    "input": gs.zeros(4),
+                    "dim": 0,
+                    "index": gs.array([0, 2, 2, 3, 0]),
+                    "src": gs.array([1.0, 2.0, 3.0, 4.0, 5.0]),
+                },
+                expected=gs.array([6.0, 0.0, 5.0, 4.0]),
+            ),
+            dict(
+                func_name="scatter_add",
+                kwargs={
+                    "input": gs.zeros((2, 3)),
+                    "dim": -1,
+                    "index": gs.array([[0, 0, 2], [1, 2, 1]]),
+                    "src": gs.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]),
+                },
+                expected=gs.array([[3.0, 0.0, 3.0], [0.0, 10.0, 5.0]]),
+            ),
+            dict(
+                func_name="scatter_add",
+                kwargs={
+                    "input": gs.zeros((2, 3, 2)),
+                    "dim": -2,
+                    "index": gs.broadcast_to(gs.array([[0], [2], [0]]), (2, 3, 2)),
+                    "src": gs.reshape(gs.arange(12.0), (2, 3, 2)),
+                },
+                expected=gs.array(
+                    [
+                        [[4.0, 6.0], [0.0, 0.0], [2.0, 3.0]],
+                        [[16.0, 18.0], [0.0, 0.0], [8.0, 9.0]],
+                    ]
+                ),
+            ),
+        ]
+
+        return self.generate_tests(smoke_data)
@@ -1,8 +1,14 @@
 from geomstats.test.parametrizers import DataBasedParametrizer
+from geomstats.test.test_case import np_and_torch_only
 from geomstats.test_cases.backend import BackendTestCase
 
-from .data.backend import BackendTestData
+from .data.backend import BackendTestData, ScatterAddTestData
 
 
 class TestBackend(BackendTestCase, metaclass=DataBasedParametrizer):
     testing_data = BackendTestData()
+
+
+@np_and_torch_only
+class TestScatterAdd(BackendTestCase, metaclass=DataBasedParametrizer):
+    testing_data = ScatterAddTestData()
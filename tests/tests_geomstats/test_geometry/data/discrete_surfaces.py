@@ -53,12 +53,19 @@ class DiscreteSurfacesTestData(ManifoldTestData):
 class DiscreteSurfacesSmokeTestData(TestData):
     vertices, _ = data_utils.load_cube()
     vertices = gs.array(vertices, dtype=gs.float64)
+    sheared_vertices = vertices * gs.array([1.5, 1.0, 0.75]) + 0.3 * gs.flip(
+        vertices, axis=-1
+    )
 
     def vertex_areas_test_data(self):
         number_of_contact_faces = gs.array([3, 5, 5, 5, 5, 5, 3, 5])
         triangle_area = 0.5 * 2 * 2
         expected = 2 * (number_of_contact_faces * triangle_area) / 3
 
+        stretched_vertices = self.vertices * gs.array([2.0, 1.0, 1.0])
+        sum_incident_areas = gs.array([10.0, 16.0, 18.0, 16.0, 18.0, 16.0, 10.0, 16.0])
+        stretched_expected = 2 * sum_incident_areas / 3
+
         data = [
             dict(point=self.vertices, expected=expected),
             dict(
@@ -67,10 +74,36 @@ class DiscreteSurfacesSmokeTestData(TestData):
                 ),
                 expected=repeat_point(expected),
             ),
+            dict(point=stretched_vertices, expected=stretched_expected),
         ]
 
         return self.generate_tests(data)
 
+    def areas_against_face_areas_test_data(self):
+        small_vertices = 0.01 * self.vertices
+        data = [
+            dict(point=small_vertices),
+            dict(point=repeat_point(small_vertices)),
+        ]
+        return self.generate_tests(data)
+
+    def _metric_diff_data(self):
+        tangent_vec = gs.reshape(gs.sin(gs.arange(24.0)), (8, 3))
+        data = [
+            dict(point=self.sheared_vertices, tangent_vec=tangent_vec),
+            dict(
+                point=repeat_point(self.sheared_vertices),
+                tangent_vec=repeat_point(tangent_vec),
+            ),
+        ]
+        return self.generate_tests(data)
+
+    def surface_metric_matrices_diff_test_data(self):
+        return self._metric_diff_data()
+
+    def normals_diff_test_data(self):
+        return self._metric_diff_data()
+
     def normals_test_data(self):
         expected = cube_normals = gs.array(
             [
@@ -132,6 +165,48 @@ class ElasticMetricTestData(TestData):
 
     tolerances = {"exp_after_log": {"atol": 1e-1}}
 
+    vertices, _ = data_utils.load_cube()
+    vertices = gs.array(vertices, dtype=gs.float64)
+    sheared_vertices = vertices * gs.array([1.5, 1.0, 0.75]) + 0.3 * gs.flip(
+        vertices, axis=-1
+    )
+
+    def inner_product_order_1_term_test_data(self):
+        tangent_vec_a = gs.reshape(gs.sin(gs.arange(24.0)), (8, 3))
+        tangent_vec_b = gs.reshape(gs.cos(gs.arange(24.0)), (8, 3))
+        data = [
+            dict(
+                coefficient=coefficient,
+                tangent_vec_a=tangent_vec_a,
+                tangent_vec_b=tangent_vec_b,
+                base_point=self.sheared_vertices,
+            )
+            for coefficient in ["a1", "b1", "c1", "d1"]
+        ]
+        return self.generate_tests(data)
+
+    def inner_product_with_coefficients_test_data(self):
+        # infinitesimal rotation about the z-axis: the d1 integrand is
+        # 8 (e_z . n_f)^2, on the 4 triangles orthogonal to e_z of area 4
+        rotation = gs.stack(
+            [
+                -self.vertices[:, 1],
+                self.vertices[:, 0],
+                gs.zeros_like(self.vertices[:, 2]),
+            ],
+            axis=-1,
+        )
+        data = [
+            dict(
+                coefficients=dict(a0=0.0, a1=0.0, b1=0.0, c1=0.0, d1=1.0, a2=0.0),
+                tangent_vec_a=rotation,
+                tangent_vec_b=rotation,
+                base_point=self.vertices,
+                expected=gs.array(128.0),
+            ),
+        ]
+        return self.generate_tests(data)
+
     def exp_after_log_test_data(self):
         return self.generate_random_data(marks=(pytest.mark.slow, pytest.mark.xfail))
 
@@ -141,6 +216,26 @@ class ElasticMetricTestData(TestData):
     def inner_product_is_symmetric_test_data(self):
         return self.generate_random_data()
 
+    def inner_product_against_default_test_data(self):
+        options = [
+            dict(metric_kwargs={}, use_base_point_data=False),
+            dict(metric_kwargs={}, use_base_point_data=True),
+            dict(
+                metric_kwargs={"compute_dtype": gs.float32},
+                use_base_point_data=False,
+                rtol=1e-4,
+            ),
+        ]
+        data = [
+            dict(n_points=n_points, **option)
+            for n_points in self.N_RANDOM_POINTS
+            for option in options
+        ]
+        return self.generate_tests(data)
+
+    def inner_product_raises_with_stale_base_point_data_test_data(self):
+        return self.generate_random_data()
+
 
 class L2SurfacesMetricTestData(RiemannianMetricTestData):
     trials = 1
@@ -2,7 +2,14 @@ import pytest
 
 import geomstats.backend as gs
 import geomstats.datasets.utils as data_utils
-from geomstats.geometry.discrete_surfaces import DiscreteSurfaces, L2SurfacesMetric
+from geomstats.geometry.discrete_surfaces import (
+    DiscreteSurfaces,
+    ElasticMetric,
+    L2SurfacesMetric,
+    _normals_diff,
+    _surface_metric_matrices_diff,
+)
+from geomstats.geometry.matrices import Matrices
 from geomstats.test.parametrizers import DataBasedParametrizer
 from geomstats.test.test_case import pytorch_backend, torch_only
 from geomstats.test_cases.geometry.discrete_surfaces import (
@@ -23,6 +30,50 @@ from .data.discrete_surfaces import (
 )
 
 
+def _order_1_term(space, coefficient, tangent_vec_a, tangent_vec_b, base_point):
+    """Compute a term of order 1 of the elastic metric from its definition."""
+    metric_mats = space.surface_metric_matrices(base_point)
+    metric_mats_inv = gs.linalg.inv(metric_mats)
+    areas = gs.sqrt(gs.linalg.det(metric_mats))
+
+    if coefficient in ("a1", "b1"):
+        ginvdga = gs.matmul(
+            metric_mats_inv,
+            space.surface_metric_matrices(base_point + tangent_vec_a) - metric_mats,
+        )
+        ginvdgb = gs.matmul(
+            metric_mats_inv,
+            space.surface_metric_matrices(base_point + tangent_vec_b) - metric_mats,
+        )
+        if coefficient == "a1":
+            integrand = gs.trace(gs.matmul(ginvdga, ginvdgb))
+        else:
+            integrand = gs.trace(ginvdga) * gs.trace(ginvdgb)
+    elif coefficient == "c1":
+        normals = space.normals(base_point)
+        dna = space.normals(base_point + tangent_vec_a) - normals
+        dnb = space.normals(base_point + tangent_vec_b) - normals
+        integrand = gs.sum(dna * dnb, axis=-1)
+    else:
+        one_forms = space.surface_one_forms(base_point)
+        xis = []
+        for tangent_vec in (tangent_vec_a, tangent_vec_b):
+            d_one_forms = space.surface_one_forms(tangent_vec)
+            xis.append(
+                gs.matmul(d_one_forms, Matrices.transpose(one_forms))
+                - gs.matmul(one_forms, Matrices.transpose(d_one_forms))
+            )
+        xia, xib = xis
+        integrand = gs.trace(
+            gs.matmul(
+                gs.matmul(metric_mats_inv, xia),
+                gs.matmul(metric_mats_inv, Matrices.transpose(xib)),
+            )
+        )
+
+    return gs.sum(integrand * areas, axis=-1)
+
+
 @pytest.mark.smoke
 class TestSurface(SurfaceTestCase, metaclass=DataBasedParametrizer):
     testing_data = SurfaceTestData()
@@ -60,6 +111,24 @@ class TestDiscreteSurfacesSmoke(
 
     testing_data = DiscreteSurfacesSmokeTestData()
 
+    def test_surface_metric_matrices_diff(self, point, tangent_vec, atol):
+        res = _surface_metric_matrices_diff(
+            self.space.surface_one_forms(tangent_vec),
+            self.space.surface_one_forms(point),
+        )
+        expected = self.space.surface_metric_matrices(
+            point + tangent_vec
+        ) - self.space.surface_metric_matrices(point)
+        self.assertAllClose(res, expected, atol=atol)
+
+    def test_normals_diff(self, point, tangent_vec, atol):
+        res = _normals_diff(
+            self.space.surface_one_forms(tangent_vec),
+            self.space.surface_one_forms(point),
+        )
+        expected = self.space.normals(point + tangent_vec) - self.space.normals(point)
+        self.assertAllClose(res, expected, atol=atol)
+
 
 @torch_only
 class TestElasticMetric(RiemannianMetricTestCase, metaclass=DataBasedParametrizer):
@@ -78,6 +147,70 @@ class TestElasticMetric(RiemannianMetricTestCase, metaclass=DataBasedParametrize
         )
     testing_data = ElasticMetricTestData()
 
+    @pytest.mark.smoke
+    def test_inner_product_order_1_term(
+        self, coefficient, tangent_vec_a, tangent_vec_b, base_point, atol
+    ):
+        coefficients = dict(a0=0.0, a1=0.0, b1=0.0, c1=0.0, d1=0.0, a2=0.0)
+        coefficients[coefficient] = 1.0
+        metric = ElasticMetric(self.space, **coefficients)
+
+        res = metric.inner_product(tangent_vec_a, tangent_vec_b, base_point)
+        expected = _order_1_term(
+            self.space, coefficient, tangent_vec_a, tangent_vec_b, base_point
+        )
+        self.assertAllClose(res, expected, atol=atol)
+
+    @pytest.mark.smoke
+    def test_inner_product_with_coefficients(
+        self, coefficients, tangent_vec_a, tangent_vec_b, base_point, expected, atol
+    ):
+        metric = ElasticMetric(self.space, **coefficients)
+        res = metric.inner_product(tangent_vec_a, tangent_vec_b, base_point)
+        self.assertAllClose(res, expected, atol=atol)
+
+    @pytest.mark.random
+    def test_inner_product_against_default(
+        self, n_points, metric_kwargs, use_base_point_data, rtol
+    ):
+        base_point = self.data_generator.random_point(n_points)
+        tangent_vecs_a = gs.stack(
+            [self.data_generator.random_tangent_vec(base_point) for _ in range(2)]
+        )
+        tangent_vecs_b = gs.stack(
+            [self.data_generator.random_tangent_vec(base_point) for _ in range(2)]
+        )
+
+        expected = gs.stack(
+            [
+                self.space.metric.inner_product(
+                    tangent_vec_a, tangent_vec_b, base_point
+                )
+                for tangent_vec_a, tangent_vec_b in zip(tangent_vecs_a, tangent_vecs_b)
+            ]
+        )
+
+        metric = ElasticMetric(self.space, **metric_kwargs)
+        base_point_data = metric.prepare(base_point) if use_base_point_data else None
+        res = metric.inner_product(
+            tangent_vecs_a, tangent_vecs_b, base_point, base_point_data=base_point_data
+        )
+        self.assertEqual(res.dtype, expected.dtype)
+        self.assertAllClose(res, expected, rtol=rtol)
+
+    @pytest.mark.random
+    def test_inner_product_raises_with_stale_base_point_data(self, n_points):
+        base_point = self.data_generator.random_point(n_points)
+        tangent_vec = self.data_generator.random_tangent_vec(base_point)
+
+        metric = ElasticMetric(self.space, a2=0.0)
+        base_point_data = metric.prepare(base_point)
+        metric.a2 = 1.0
+        with pytest.raises(ValueError):
+            metric.inner_product(
+                tangent_vec, tangent_vec, base_point, base_point_data=base_point_data
+            )
+
 
 class TestL2SurfacesMetric(RiemannianMetricTestCase, metaclass=DataBasedParametrizer):
     _, _faces = data_utils.load_cube()